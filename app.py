@@ -1,6 +1,12 @@
 import os, uuid, datetime as dt
-from flask import Flask, request, jsonify, abort
+import orjson
+from flask import Flask, Response, request, abort, g, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.schema import CreateIndex, DropIndex
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.dialects.postgresql import JSONB
 from flask_cors import CORS
 
@@ -13,10 +19,45 @@ def require_key():
 def utcnow():
     return dt.datetime.utcnow()
 
+def parse_ts(s: str) -> dt.datetime:
+    """Parse a client ISO8601 timestamp as naive UTC (matches the DateTime columns)."""
+    if s.endswith("Z"):
+        s = s[:-1]
+    try:
+        ts = dt.datetime.fromisoformat(s)
+    except ValueError:
+        abort(400, "invalid ISO8601 timestamp")
+    if ts.tzinfo:
+        ts = ts.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return ts
+
+def get_now():
+    """utcnow() memoized for the current request, so every write in a handler shares one timestamp."""
+    now = g.get("now")
+    if now is None:
+        now = g.now = utcnow()
+    return now
+
+class OrjsonProvider(JSONProvider):
+    """orjson-backed JSON for requests/responses; naive datetimes are emitted as UTC ISO8601 with 'Z'."""
+    mimetype = "application/json"
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype=self.mimetype)
+
 db = SQLAlchemy()
 
 def create_app():
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # psycopg3 URL normalization
     db_url = os.getenv("DATABASE_URL", "sqlite:///local.db")
@@ -27,12 +68,34 @@ def create_app():
 
     app.config["SQLALCHEMY_DATABASE_URI"] = db_url
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-    CORS(app)
+    if not db_url.startswith("sqlite"):
+        # Reuse connections across requests instead of re-handshaking per worker.
+        # Behind PgBouncer (transaction mode, port 6432) set PGBOUNCER=1 and DB_POOL_SIZE small, e.g. 2.
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            "pool_timeout": 30,
+            "pool_pre_ping": True,   # drop dead connections before use
+            "pool_recycle": 1800,    # recycle before managed PG idle timeouts
+            "isolation_level": "READ COMMITTED",
+            # JSONB binds/results go through orjson instead of the stdlib json module
+            "json_serializer": lambda obj: orjson.dumps(obj).decode(),
+            "json_deserializer": orjson.loads,
+        }
+        if os.getenv("PGBOUNCER") == "1":
+            # psycopg3 auto-prepares reused statements; prepared statements don't survive transaction pooling
+            app.config["SQLALCHEMY_ENGINE_OPTIONS"]["connect_args"] = {"prepare_threshold": None}
+    # Browsers cache preflights for a day, so most OPTIONS round-trips disappear
+    CORS(app, origins=os.getenv("CORS_ORIGINS", "*").split(","), max_age=86400)
     db.init_app(app)
+    if db_url.startswith("sqlite"):
+        # SQLite only honours ON DELETE CASCADE with foreign keys switched on per connection
+        with app.app_context():
+            event.listen(db.engine, "connect", lambda cx, _: cx.execute("PRAGMA foreign_keys=ON"))
 
     @app.get("/ping")
     def ping():
-        return {"ok": True, "time": utcnow().isoformat()}
+        return {"ok": True, "time": get_now()}
 
     # ---------- MODELS ----------
     class EditorContent(db.Model):
@@ -49,13 +112,15 @@ def create_app():
         container_id: parent entity (for lists under a project/process); NULL for containers and general lists
         """
         __tablename__ = "index_entries"
+        # Serves sibling MAX("order") and ORDER BY container_id, "order"
+        __table_args__ = (db.Index("ix_index_entries_container_order", "container_id", "order"),)
         id = db.Column(db.String, primary_key=True)
         kind = db.Column(db.String(16), nullable=False)  # project | process | list
         container_id = db.Column(db.String, db.ForeignKey("index_entries.id", ondelete="CASCADE"), nullable=True)
         name = db.Column(db.String(160), nullable=False)
         emoji = db.Column(db.String(8), nullable=True)
         color = db.Column(db.BigInteger, nullable=False, default=0xFF6AA6FF)
-        order = db.Column(db.Integer, nullable=False, default=0, index=True)  # NEW
+        order = db.Column(db.Integer, nullable=False, default=0)  # NEW
         opened_at = db.Column(db.DateTime, nullable=True, index=True)
         updated_at = db.Column(db.DateTime, nullable=False, default=utcnow, index=True)
 
@@ -72,43 +137,140 @@ def create_app():
         updated_at = db.Column(db.DateTime, nullable=False, default=utcnow, index=True)
 
     # ---------- Helpers ----------
-    def idx_json(e: IndexEntry):
-        return {
-            "id": e.id,
-            "kind": e.kind,
-            "container_id": e.container_id,
-            "name": e.name,
-            "emoji": e.emoji,
-            "color": e.color,
-            "order": e.order,  # NEW
-            "opened_at": e.opened_at.isoformat() if e.opened_at else None,
-            "updated_at": e.updated_at.isoformat(),
-        }
-
-    def _next_order_for_container(container_id: str | None) -> int:
-        """Return max(order)+1 among siblings (same container_id)."""
-        max_ord = db.session.query(db.func.coalesce(db.func.max(IndexEntry.order), -1)) \
-            .filter(IndexEntry.container_id == container_id).scalar()
-        return int(max_ord) + 1
+    _INDEX_COLUMNS = (
+        IndexEntry.id, IndexEntry.kind, IndexEntry.container_id, IndexEntry.name, IndexEntry.emoji,
+        IndexEntry.color, IndexEntry.order, IndexEntry.opened_at, IndexEntry.updated_at,
+    )
+
+    _INDEX_KEYS = tuple(c.key for c in _INDEX_COLUMNS)
+
+    def idx_json(e):
+        """Serialize a row selected with _INDEX_COLUMNS (zip is far cheaper than per-key attribute lookups)."""
+        return dict(zip(_INDEX_KEYS, e))
+
+    _INDEX_PAGE, _INDEX_PAGE_MAX = 500, 5000
+
+    def _stream_index(rows, limit: int | None):
+        """Yield the /index body batch by batch; with a limit, wrap in {"items", "next_cursor"}."""
+        option = app.json.option
+        yield b'{"items":[' if limit else b"["
+        sep, count, last = b"", 0, None
+        for batch in rows.partitions():
+            yield sep + b",".join(orjson.dumps(idx_json(e), option=option) for e in batch)
+            sep, count, last = b",", count + len(batch), batch[-1]
+        if not limit:
+            yield b"]"
+            return
+        next_cursor = f"{last.updated_at.isoformat()}|{last.id}" if count == limit else None
+        yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+
+    def _next_order_for_container(container_id: str | None):
+        """Scalar subquery for max(order)+1 among siblings (same container_id); evaluated inside the INSERT."""
+        # == None renders IS NULL; both forms stay usable by ix_index_entries_container_order
+        return db.select(db.func.coalesce(db.func.max(IndexEntry.order), -1) + 1) \
+            .where(IndexEntry.container_id == container_id) \
+            .scalar_subquery()
+
+    def _is_pg() -> bool:
+        return db.engine.dialect.name.startswith("postgres")
+
+    # Postgres: both tables in one round-trip via data-modifying CTEs; the outer SELECT drives the 404.
+    _PG_UPDATE_CONTENT = db.text("""
+        WITH lc AS (
+            UPDATE list_contents
+               SET content_json = :c, "order" = COALESCE(:o, "order"), updated_at = :t
+             WHERE id = :id
+         RETURNING id
+        ), ie AS (
+            UPDATE index_entries
+               SET "order" = COALESCE(:o, "order"), updated_at = :t
+             WHERE id IN (SELECT id FROM lc)
+        )
+        SELECT id FROM lc
+    """).bindparams(db.bindparam("c", type_=JSONB), db.bindparam("o", type_=db.Integer))
+
+    _PG_UPDATE_ORDER = db.text("""
+        WITH ie AS (
+            UPDATE index_entries SET "order" = :o, updated_at = :t
+             WHERE id = :id
+         RETURNING id
+        ), lc AS (
+            UPDATE list_contents SET "order" = :o, updated_at = :t
+             WHERE id IN (SELECT id FROM ie)
+        )
+        SELECT id FROM ie
+    """)
+
+    # Prebuilt Core statements for the hot paths: built once, compiled once, then only rebound per request
+    _ie, _lc, _ec = IndexEntry.__table__, ListContent.__table__, EditorContent.__table__
+    # content_json comes back as its JSON text (no driver-side parse) and is spliced into the response as-is
+    _SELECT_CONTENT = db.select(_lc.c.id, _lc.c.container_id, _lc.c.order, _lc.c.updated_at,
+                                db.cast(_lc.c.content_json, db.Text).label("content_json")) \
+        .where(_lc.c.id == db.bindparam("_id"))
+    _SELECT_EDITOR = db.select(_ec.c.location, _ec.c.content, _ec.c.updated_at) \
+        .where(_ec.c.location == db.bindparam("_loc"))
+    _UPDATE_CONTENT = db.update(_lc).where(_lc.c.id == db.bindparam("_id")).values(
+        content_json=db.bindparam("_c"),
+        order=db.func.coalesce(db.bindparam("_o", type_=db.Integer), _lc.c.order),
+        updated_at=db.bindparam("_t"),
+    )
+    _TOUCH_INDEX = db.update(_ie).where(_ie.c.id == db.bindparam("_id")).values(
+        order=db.func.coalesce(db.bindparam("_o", type_=db.Integer), _ie.c.order),
+        updated_at=db.bindparam("_t"),
+    )
+    _UPDATE_INDEX_ORDER = db.update(_ie).where(_ie.c.id == db.bindparam("_id")) \
+        .values(order=db.bindparam("_o"), updated_at=db.bindparam("_t"))
+    _UPDATE_CONTENT_ORDER = db.update(_lc).where(_lc.c.id == db.bindparam("_id")) \
+        .values(order=db.bindparam("_o"), updated_at=db.bindparam("_t"))
+
+    # Secondary indexes dropped around large/initial bulk loads and rebuilt once afterwards:
+    # the model's own indexes plus the GIN index that only exists in the Postgres DDL
+    _PG_GIN_INDEX = "ix_list_contents_content_json_path_ops"
+    _PG_GIN_INDEX_DDL = f"CREATE INDEX IF NOT EXISTS {_PG_GIN_INDEX} ON list_contents USING GIN (content_json jsonb_path_ops)"
+    _BULK_INDEXES = (*IndexEntry.__table__.indexes, *ListContent.__table__.indexes)
+    _BULK_REBUILD_MIN = 5000  # below this, into a non-empty table, maintaining indexes row by row is cheaper
+    _INDEX_COPY_COLS = ("id", "kind", "container_id", "name", "emoji", "color", "order", "opened_at", "updated_at")
+    _CONTENT_COPY_COLS = ("id", "container_id", "order", "content_json", "updated_at")
 
     # ---------- API ----------
     @app.get("/index")
     def get_index():
-        """Fast list for the front menu (metadata only). Optional ?updated_since=ISO8601&sort=order"""
+        """
+        Fast list for the front menu (metadata only). Optional ?updated_since=ISO8601&sort=order
+        Paging (sort=updated_at only): ?limit=500&cursor=<next_cursor> -> {"items": [...], "next_cursor": str|null}
+        Rows are streamed in batches either way.
+        """
         require_key()
         since = request.args.get("updated_since")
         sort = request.args.get("sort", "updated_at")
-        q = IndexEntry.query
+        limit = request.args.get("limit")
+        if limit is not None:
+            if not limit.isdecimal() or int(limit) < 1:
+                abort(400, "limit must be a positive integer")
+            limit = int(limit)
+        cursor = request.args.get("cursor")
+        paged = limit is not None or cursor is not None
+        if paged and sort == "order":
+            abort(400, "limit/cursor require sort=updated_at")
+        # Plain column select: rows come back as named tuples, no ORM instances to hydrate
+        q = db.select(*_INDEX_COLUMNS)
         if since:
-            ts = dt.datetime.fromisoformat(since.replace("Z", ""))
-            q = q.filter(IndexEntry.updated_at > ts)
+            ts = parse_ts(since)
+            q = q.where(IndexEntry.updated_at > ts)
         if sort == "order":
             # Group by container, then stable by order, then updated_at for tiebreak
             q = q.order_by(IndexEntry.container_id.asc(), IndexEntry.order.asc(), IndexEntry.updated_at.desc())
+        elif paged:
+            limit = min(limit or _INDEX_PAGE, _INDEX_PAGE_MAX)
+            if cursor:
+                cur_t, _, cur_id = cursor.rpartition("|")
+                q = q.where(db.tuple_(IndexEntry.updated_at, IndexEntry.id) < (parse_ts(cur_t), cur_id))
+            q = q.order_by(IndexEntry.updated_at.desc(), IndexEntry.id.desc()).limit(limit)
         else:
             q = q.order_by(IndexEntry.updated_at.desc())
-        rows = q.all()
-        return jsonify([idx_json(e) for e in rows])
+        rows = db.session.execute(q.execution_options(yield_per=_INDEX_PAGE))
+        return Response(stream_with_context(_stream_index(rows, limit if paged else None)),
+                        mimetype="application/json")
 
     @app.post("/entities")
     def create_entity():
@@ -144,17 +306,20 @@ def create_app():
             abort(400, "containers cannot have container_id")
 
         _id = str(uuid.uuid4())
-        now = utcnow()
-
-        effective_order = int(requested_order) if requested_order is not None else _next_order_for_container(container_id)
-
-        idx = IndexEntry(
-            id=_id, kind=kind, container_id=container_id, name=name, emoji=emoji,
-            color=color, order=effective_order, opened_at=now, updated_at=now
-        )
-        db.session.add(idx)
-        db.session.add(ListContent(id=_id, container_id=container_id, order=effective_order,
-                                   content_json=content_json, updated_at=now))
+        now = get_now()
+
+        order = int(requested_order) if requested_order is not None else _next_order_for_container(container_id)
+
+        # Sibling order is resolved in the same statement as the insert; RETURNING hands it back
+        effective_order = db.session.execute(
+            db.insert(IndexEntry).values(
+                id=_id, kind=kind, container_id=container_id, name=name, emoji=emoji,
+                color=color, order=order, opened_at=now, updated_at=now,
+            ).returning(IndexEntry.order)
+        ).scalar_one()
+        db.session.execute(db.insert(ListContent).values(
+            id=_id, container_id=container_id, order=effective_order, content_json=content_json, updated_at=now,
+        ))
         db.session.commit()
         return {"id": _id, "kind": kind, "container_id": container_id, "order": effective_order}, 201
 
@@ -165,7 +330,10 @@ def create_app():
         - Deleting a container cascades to its child lists (index + content).
         """
         require_key()
-        IndexEntry.query.filter_by(id=entity_id).delete(synchronize_session=False)
+        # Children (lists, list_contents rows) go via ON DELETE CASCADE in the database, never by hand
+        deleted = db.session.execute(db.delete(_ie).where(_ie.c.id == entity_id)).rowcount
+        if not deleted:
+            abort(404)
         db.session.commit()
         return {"ok": True}
 
@@ -173,14 +341,17 @@ def create_app():
     def get_content(entity_id):
         """Fetch content_json for any entity."""
         require_key()
-        row = ListContent.query.get_or_404(entity_id)
-        return {
+        row = db.session.execute(_SELECT_CONTENT, {"_id": entity_id}).first()
+        if not row:
+            abort(404)
+        meta = orjson.dumps({
             "id": row.id,
             "container_id": row.container_id,
             "order": row.order,  # NEW
-            "content_json": row.content_json,
-            "updated_at": row.updated_at.isoformat()
-        }
+            "updated_at": row.updated_at,
+        }, option=app.json.option)
+        body = b"".join((meta[:-1], b',"content_json":', row.content_json.encode(), b"}"))
+        return Response(body, mimetype="application/json")
 
     @app.put("/content/<entity_id>")
     def update_content(entity_id):
@@ -189,19 +360,22 @@ def create_app():
         d = request.get_json(force=True) or {}
         if "content_json" not in d:
             abort(400, "content_json required")
-        now = utcnow()
-        row = ListContent.query.get_or_404(entity_id)
-        row.content_json = d["content_json"]
-        row.updated_at = now
-
-        if "order" in d and d["order"] is not None:
-            new_order = int(d["order"])
-            row.order = new_order
-            IndexEntry.query.filter_by(id=entity_id).update({"order": new_order})
+        now = get_now()
+        new_order = int(d["order"]) if d.get("order") is not None else None
 
-        IndexEntry.query.filter_by(id=entity_id).update({"updated_at": now})
+        if _is_pg():
+            found = db.session.execute(_PG_UPDATE_CONTENT, {
+                "id": entity_id, "c": d["content_json"], "o": new_order, "t": now,
+            }).first()
+        else:
+            params = {"_id": entity_id, "_c": d["content_json"], "_o": new_order, "_t": now}
+            found = db.session.execute(_UPDATE_CONTENT, params).rowcount
+            if found:
+                db.session.execute(_TOUCH_INDEX, params)
+        if not found:
+            abort(404)
         db.session.commit()
-        return {"ok": True, "updated_at": now.isoformat()}
+        return {"ok": True, "updated_at": now}
 
     @app.put("/entities/<entity_id>")
     def update_entity_meta(entity_id):
@@ -211,7 +385,7 @@ def create_app():
         """
         require_key()
         d = request.get_json(force=True) or {}
-        now = utcnow()
+        now = get_now()
 
         updates = {}
         for k in ("name", "emoji", "color"):
@@ -221,15 +395,26 @@ def create_app():
             updates["opened_at"] = now
         if "order" in d and d["order"] is not None:
             updates["order"] = int(d["order"])
-            ListContent.query.filter_by(id=entity_id).update({"order": int(d["order"]), "updated_at": now})
 
         updates["updated_at"] = now
 
-        changed = IndexEntry.query.filter_by(id=entity_id).update(updates)
-        if not changed:
+        update_index = db.update(_ie).where(_ie.c.id == entity_id).values(**updates)
+        update_content = db.update(_lc).values(order=updates.get("order"), updated_at=now)
+        if _is_pg():
+            # One round-trip: list_contents follows the index row via a data-modifying CTE; RETURNING drives the 404
+            ie = update_index.returning(_ie.c.id).cte("ie")
+            q = db.select(ie.c.id)
+            if "order" in updates:
+                q = q.add_cte(update_content.where(_lc.c.id.in_(db.select(ie.c.id))).cte("lc"))
+            found = db.session.execute(q).first()
+        else:
+            found = db.session.execute(update_index).rowcount
+            if found and "order" in updates:
+                db.session.execute(update_content.where(_lc.c.id == entity_id))
+        if not found:
             abort(404)
         db.session.commit()
-        return {"ok": True, "updated_at": now.isoformat()}
+        return {"ok": True, "updated_at": now}
 
     @app.put("/entities/<entity_id>/order")
     def update_entity_order(entity_id):
@@ -239,24 +424,166 @@ def create_app():
         if "order" not in d:
             abort(400, "order required")
         new_order = int(d["order"])
-        now = utcnow()
-        changed = IndexEntry.query.filter_by(id=entity_id).update({"order": new_order, "updated_at": now})
+        now = get_now()
+        if _is_pg():
+            changed = db.session.execute(_PG_UPDATE_ORDER, {"id": entity_id, "o": new_order, "t": now}).first()
+        else:
+            params = {"_id": entity_id, "_o": new_order, "_t": now}
+            changed = db.session.execute(_UPDATE_INDEX_ORDER, params).rowcount
+            if changed:
+                db.session.execute(_UPDATE_CONTENT_ORDER, params)
         if not changed:
             abort(404)
-        ListContent.query.filter_by(id=entity_id).update({"order": new_order, "updated_at": now})
         db.session.commit()
-        return {"ok": True, "updated_at": now.isoformat(), "order": new_order}
+        return {"ok": True, "updated_at": now, "order": new_order}
+
+    @app.put("/entities/order")
+    def reorder_entities():
+        """
+        Bulk reorder siblings in one statement (kept in both tables).
+        Body: {"container_id": "UUID or null", "ids": ["id0", "id1", ...]} -> each id gets its position as order.
+        Ids outside container_id are left untouched.
+        """
+        require_key()
+        d = request.get_json(force=True) or {}
+        if "container_id" not in d:
+            abort(400, "container_id required (null for top level)")
+        container_id = d["container_id"]
+        ids = d.get("ids")
+        if not isinstance(ids, list) or not ids or not all(isinstance(i, str) for i in ids):
+            abort(400, "ids (non-empty list of strings) required")
+        if len(set(ids)) != len(ids):
+            abort(400, "ids must be unique")
+        now = get_now()
+
+        if _is_pg():
+            params = {"t": now, "cid": container_id}
+            for i, _id in enumerate(ids):
+                params[f"id{i}"] = _id
+                params[f"o{i}"] = i
+            values = ", ".join(f"(:id{i}, CAST(:o{i} AS INTEGER))" for i in range(len(ids)))
+            in_container = "= :cid" if container_id is not None else "IS NULL"
+            changed = db.session.execute(db.text(f"""
+                WITH v(id, idx) AS (VALUES {values}),
+                ie AS (
+                    UPDATE index_entries AS e SET "order" = v.idx, updated_at = :t
+                      FROM v WHERE e.id = v.id AND e.container_id {in_container}
+                 RETURNING e.id
+                ), lc AS (
+                    UPDATE list_contents AS c SET "order" = v.idx, updated_at = :t
+                      FROM v WHERE c.id = v.id AND c.container_id {in_container}
+                )
+                SELECT count(*) FROM ie
+            """), params).scalar()
+        else:
+            # executemany over Core tables (no ORM bulk-by-PK semantics); == None renders IS NULL
+            rows = [{"_id": _id, "_o": i, "_t": now} for i, _id in enumerate(ids)]
+            changed = db.session.execute(
+                _UPDATE_INDEX_ORDER.where(_ie.c.container_id == container_id), rows).rowcount
+            db.session.execute(_UPDATE_CONTENT_ORDER.where(_lc.c.container_id == container_id), rows)
+        db.session.commit()
+        return {"ok": True, "updated_at": now, "count": changed}
+
+    @app.post("/admin/bulk_import")
+    def bulk_import():
+        """
+        Initial load / restore of entities (index + content).
+        Body: {"entries": [{"id", "kind", "name", "container_id"?, "emoji"?, "color"?, "order"?,
+                            "opened_at"?, "updated_at"?, "content_json"?}, ...]}
+        Postgres: COPY; for an empty table or a large batch, drop secondary indexes first,
+        rebuild them afterwards and CLUSTER by container. Existing/duplicate ids -> 409.
+        """
+        require_key()
+        d = request.get_json(force=True) or {}
+        entries = d.get("entries")
+        if not isinstance(entries, list):
+            abort(400, "entries (list) required")
+        now = get_now()
+
+        for e in entries:
+            if not isinstance(e, dict):
+                abort(400, "each entry must be an object")
+            if e.get("kind") not in ("project", "process", "list"):
+                abort(400, "kind must be 'project' | 'process' | 'list'")
+            if not isinstance(e.get("id"), str) or not e["id"] or not isinstance(e.get("name"), str):
+                abort(400, "each entry needs string id and name")
+            if len(e["name"]) > _ie.c.name.type.length:
+                abort(400, f"name longer than {_ie.c.name.type.length} characters")
+            emoji = e.get("emoji")
+            if emoji is not None and (not isinstance(emoji, str) or len(emoji) > _ie.c.emoji.type.length):
+                abort(400, f"emoji must be a string of at most {_ie.c.emoji.type.length} characters")
+            if e["kind"] in ("project", "process") and e.get("container_id") is not None:
+                abort(400, "containers cannot have container_id")
+            # bool is an int subclass; JSON true/false must not pass as an order/color
+            if any(not isinstance(e.get(k, 0), int) or isinstance(e.get(k), bool) for k in ("order", "color")):
+                abort(400, "order and color must be integers")
+        ids = [e["id"] for e in entries]
+        if len(set(ids)) != len(ids):
+            abort(409, "duplicate ids in entries")
+
+        index_rows, content_rows = [], []
+        # Containers first so container_id foreign keys resolve during the load
+        for e in sorted(entries, key=lambda e: e.get("container_id") is not None):
+            updated_at = parse_ts(e["updated_at"]) if e.get("updated_at") else now
+            opened_at = parse_ts(e["opened_at"]) if e.get("opened_at") else None
+            order = e.get("order", 0)
+            index_rows.append((e["id"], e["kind"], e.get("container_id"), e["name"], e.get("emoji"),
+                               e.get("color", 0xFF6AA6FF), order, opened_at, updated_at))
+            content_rows.append((e["id"], e.get("container_id"), order, e.get("content_json", {}), updated_at))
+
+        integrity_errors, data_errors = (IntegrityError,), (DataError,)
+        try:
+            if _is_pg():
+                import psycopg
+                from psycopg.types.json import Jsonb
+                integrity_errors += (psycopg.errors.IntegrityError,)
+                data_errors += (psycopg.errors.DataError,)
+
+                cx = db.session.connection()
+                rebuild = len(index_rows) >= _BULK_REBUILD_MIN or \
+                    cx.execute(db.select(_ie.c.id).limit(1)).first() is None
+                if rebuild:
+                    for index in _BULK_INDEXES:
+                        cx.execute(DropIndex(index, if_exists=True))
+                    cx.execute(db.text(f"DROP INDEX IF EXISTS {_PG_GIN_INDEX}"))
+                with cx.connection.driver_connection.cursor() as cur:
+                    cols = ", ".join(f'"{c}"' for c in _INDEX_COPY_COLS)
+                    with cur.copy(f"COPY index_entries ({cols}) FROM STDIN") as copy:
+                        for row in index_rows:
+                            copy.write_row(row)
+                    cols = ", ".join(f'"{c}"' for c in _CONTENT_COPY_COLS)
+                    with cur.copy(f"COPY list_contents ({cols}) FROM STDIN") as copy:
+                        for row in content_rows:
+                            copy.write_row(row[:3] + (Jsonb(row[3]),) + row[4:])
+                if rebuild:
+                    for index in _BULK_INDEXES:
+                        cx.execute(CreateIndex(index, if_not_exists=True))
+                    cx.execute(db.text(_PG_GIN_INDEX_DDL))
+                    cx.execute(db.text("CLUSTER index_entries USING ix_index_entries_container_order"))
+            else:
+                db.session.execute(db.insert(_ie), [dict(zip(_INDEX_COPY_COLS, r)) for r in index_rows])
+                db.session.execute(db.insert(_lc), [dict(zip(_CONTENT_COPY_COLS, r)) for r in content_rows])
+            db.session.commit()
+        except integrity_errors:
+            # an id that already exists, or a container_id pointing at an entity that does not
+            db.session.rollback()
+            abort(409, "entries conflict with existing data")
+        except data_errors:
+            # values the column types reject, e.g. out-of-range integers or over-long strings
+            db.session.rollback()
+            abort(400, "entries contain values the database cannot store")
+        return {"ok": True, "count": len(index_rows)}, 201
 
     @app.get("/editor_content/<string:location>")
     def get_editor_content(location):
         require_key()
-        row = EditorContent.query.get(location)
+        row = db.session.execute(_SELECT_EDITOR, {"_loc": location}).first()
         if not row:
             abort(404)
         return {
             "location": row.location,
             "content": row.content,
-            "updated_at": row.updated_at.isoformat()
+            "updated_at": row.updated_at
         }
 
     @app.put("/editor_content/<string:location>")
@@ -266,32 +593,42 @@ def create_app():
         content = d.get("content")
         if content is None or not isinstance(content, str):
             abort(400, "content (string) required")
-        now = utcnow()
-        row = EditorContent.query.get(location)
-        if row:
-            row.content = content
-            row.updated_at = now
-        else:
-            row = EditorContent(location=location, content=content, updated_at=now)
-            db.session.add(row)
+        now = get_now()
+        # Single-statement upsert; both dialects support ON CONFLICT ... DO UPDATE
+        insert = postgresql.insert if _is_pg() else sqlite.insert
+        stmt = insert(EditorContent).values(location=location, content=content, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EditorContent.location],
+            set_={"content": stmt.excluded.content, "updated_at": stmt.excluded.updated_at},
+        )
+        db.session.execute(stmt)
         db.session.commit()
-        return {"ok": True, "location": location, "updated_at": now.isoformat()}
+        return {"ok": True, "location": location, "updated_at": now}
 
     # ---------- Startup DDL (light migration) ----------
-    with app.app_context():
+    # Not run on import: every gunicorn worker would repeat it and contend on DDL locks.
+    # Run once per deploy with `flask --app app db-init`, or set RUN_MIGRATIONS=1.
+    def init_db():
+        """Create tables and apply the light migrations below."""
         db.create_all()
         eng = db.engine
         try:
-            with eng.connect() as cx:
+            with eng.begin() as cx:
                 dialect = eng.dialect.name
                 if dialect.startswith("postgres"):
-                    cx.execute(db.text("""
+                    cx.execute(db.text(f"""
                         -- existing columns/indexes
                         ALTER TABLE index_entries ADD COLUMN IF NOT EXISTS "order" INTEGER NOT NULL DEFAULT 0;
-                        CREATE INDEX IF NOT EXISTS ix_index_entries_order ON index_entries ("order");
+                        DROP INDEX IF EXISTS ix_index_entries_order;
+                        CREATE INDEX IF NOT EXISTS ix_index_entries_container_order
+                            ON index_entries (container_id, "order");
                         ALTER TABLE list_contents ADD COLUMN IF NOT EXISTS "order" INTEGER NOT NULL DEFAULT 0;
                         CREATE INDEX IF NOT EXISTS ix_list_contents_order ON list_contents ("order");
 
+                        -- containment (@>) lookups on content_json; jsonb_path_ops does not serve ->/->> or ?,
+                        -- use a BTREE expression index on (content_json->>'field') for those
+                        {_PG_GIN_INDEX_DDL};
+
                         -- NEW: editor_contents table
                         CREATE TABLE IF NOT EXISTS editor_contents (
                             location   VARCHAR(160) PRIMARY KEY,
@@ -310,7 +647,8 @@ def create_app():
                             pass
 
                     _safe('ALTER TABLE index_entries ADD COLUMN "order" INTEGER NOT NULL DEFAULT 0;')
-                    _safe('CREATE INDEX IF NOT EXISTS ix_index_entries_order ON index_entries ("order");')
+                    _safe('DROP INDEX IF EXISTS ix_index_entries_order;')
+                    _safe('CREATE INDEX IF NOT EXISTS ix_index_entries_container_order ON index_entries (container_id, "order");')
                     _safe('ALTER TABLE list_contents ADD COLUMN "order" INTEGER NOT NULL DEFAULT 0;')
                     _safe('CREATE INDEX IF NOT EXISTS ix_list_contents_order ON list_contents ("order");')
 
@@ -326,6 +664,19 @@ def create_app():
         except Exception as e:
             # Log but don’t block app start
             print("[migration warn]", e)
+
+    app.cli.command("db-init")(init_db)
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        with app.app_context():
+            init_db()
+
+    # Under `gunicorn --preload` the pool is created before fork; children must not reuse parent sockets
+    def _reset_pools_after_fork():
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
     return app
 
 app = create_app()